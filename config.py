@@ -1,15 +1,40 @@
-from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+import functools
+import hashlib
+import os
+import pickle
+from typing import Dict, List, Optional, Any, Tuple
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+import orjson
 import yaml
-import json
+
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# Pickled sidecar for YAML configs; bump the version whenever the models change
+_CACHE_SUFFIX = ".pkl"
+_CACHE_VERSION = 1
+_CACHED_SUFFIXES = ('.yaml', '.yml')
+
+# In-process memo of parsed configs, keyed on (path, content digest)
+_MAX_CONFIG_REVISIONS = 8
+_config_revisions: Dict[Tuple[str, bytes], "AdapterConfig"] = {}
+
+# Shared defaults for servers.json entries without args/env; validation copies
+# them into each ServerConfig, so they must never be mutated in place.
+_EMPTY_LIST: List[str] = []
+_EMPTY_DICT: Dict[str, str] = {}
 
 
 class ServerConfig(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str
     command: str
-    args: Optional[List[str]] = []
+    args: Optional[List[str]] = Field(default_factory=list)
     cwd: Optional[str] = None
-    env: Optional[Dict[str, str]] = {}
+    env: Optional[Dict[str, str]] = Field(default_factory=dict)
     timeout: Optional[int] = 60
     disabled: bool = False
     
@@ -17,6 +42,14 @@ class ServerConfig(BaseModel):
     def enabled(self) -> bool:
         return not self.disabled
 
+    @functools.cached_property
+    def as_dict(self) -> Dict[str, Any]:
+        """Serialized form of this config, computed once per instance.
+
+        Relies on pydantic>=2.6, where ``__eq__`` ignores cached properties.
+        """
+        return self.model_dump()
+
 
 class AdapterConfig(BaseModel):
     host: str = "localhost"
@@ -25,21 +58,104 @@ class AdapterConfig(BaseModel):
     cors_origins: List[str] = ["*"]
     servers: List[ServerConfig] = []
 
+    # stat() of the file this config was loaded from; None if it did not exist
+    _source_stat: Optional[os.stat_result] = PrivateAttr(default=None)
+
+    @property
+    def source_stat(self) -> Optional[os.stat_result]:
+        return self._source_stat
+
+
+def load_config(config_path: str, use_cache: bool = True) -> AdapterConfig:
+    """Load adapter configuration from a JSON or YAML file.
+
+    Data parsed from disk is always validated, and parsed revisions are
+    memoized in-process. For YAML files a pickled sidecar
+    (``<config_path>.pkl``) of the validated result is also reused while the
+    file's content digest is unchanged; ``use_cache=False`` neither reads nor
+    writes it.
+    """
+    try:
+        with open(config_path, 'rb') as f:
+            st = os.fstat(f.fileno())
+            raw = f.read()
+    except FileNotFoundError:
+        return AdapterConfig()
+
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    memo_key = (config_path, digest)
+    config = _config_revisions.get(memo_key)
+    if config is None:
+        use_cache = use_cache and config_path.endswith(_CACHED_SUFFIXES)
+        config = _load_config_revision(config_path, raw, digest, use_cache)
+        if len(_config_revisions) >= _MAX_CONFIG_REVISIONS:
+            del _config_revisions[next(iter(_config_revisions))]
+        _config_revisions[memo_key] = config
+
+    # Callers may mutate the adapter settings or server list; ServerConfig itself is frozen
+    config = config.model_copy(update={"servers": list(config.servers)})
+    config._source_stat = st
+    return config
+
+
+def _load_config_revision(config_path: str, raw: bytes, digest: bytes, use_cache: bool) -> AdapterConfig:
+    cache_key = (_CACHE_VERSION, digest)
+    if use_cache:
+        cached = _read_config_cache(config_path, cache_key)
+        if cached is not None:
+            return cached
 
-def load_config(config_path: str) -> AdapterConfig:
     try:
-        with open(config_path, 'r') as f:
-            data = yaml.safe_load(f) if config_path.endswith(('.yaml', '.yml')) else json.load(f)
+        if config_path.endswith(_CACHED_SUFFIXES):
+            data = yaml.load(raw, Loader=_YamlLoader)
+        else:
+            data = orjson.loads(raw)
         
         if "mcpServers" in data:
-            return _load_servers_json_format(data)
-        return AdapterConfig(**data)
+            config = _load_servers_json_format(data)
+        else:
+            config = AdapterConfig(**data)
         
-    except FileNotFoundError:
-        return AdapterConfig()
     except Exception as e:
         raise ValueError(f"Invalid configuration file: {e}")
 
+    if use_cache:
+        _write_config_cache(config_path, cache_key, config)
+    return config
+
+
+def _read_config_cache(config_path: str, cache_key: Tuple[int, bytes]) -> Optional[AdapterConfig]:
+    """Return the cached config if it was built from the same file contents and schema.
+
+    The pickle holds data that was validated when it was written, so it is
+    rehydrated with ``model_construct``.
+    """
+    try:
+        with open(config_path + _CACHE_SUFFIX, 'rb') as f:
+            key, data = pickle.load(f)
+    except Exception:
+        return None
+    if key != cache_key:
+        return None
+
+    servers = [ServerConfig.model_construct(**s) for s in data.pop("servers", [])]
+    return AdapterConfig.model_construct(servers=servers, **data)
+
+
+def _write_config_cache(config_path: str, cache_key: Tuple[int, bytes], config: AdapterConfig) -> None:
+    """Best-effort write of the parsed config next to the source file."""
+    cache_path = config_path + _CACHE_SUFFIX
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((cache_key, config.model_dump()), f, protocol=5)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
 
 def _load_servers_json_format(data: Dict[str, Any]) -> AdapterConfig:
     """Convert servers.json format to AdapterConfig."""
@@ -50,9 +166,9 @@ def _load_servers_json_format(data: Dict[str, Any]) -> AdapterConfig:
         server_config = ServerConfig(
             name=name,
             command=config["command"],
-            args=config.get("args", []),
+            args=config.get("args") or _EMPTY_LIST,
             cwd=config.get("cwd"),
-            env=config.get("env", {}),
+            env=config.get("env") or _EMPTY_DICT,
             timeout=config.get("timeout", 60),
             disabled=config.get("disabled", False)
         )
@@ -75,7 +191,8 @@ def save_config(config: AdapterConfig, config_path: str) -> None:
     else:
         # Save in YAML format
         with open(config_path, 'w') as f:
-            yaml.dump(config.dict(), f, default_flow_style=False)
+            yaml.dump(config.dict(), f, Dumper=_YamlDumper, default_flow_style=False)
+    _config_revisions.clear()
 
 
 def _save_servers_json_format(config: AdapterConfig, config_path: str) -> None:
@@ -107,5 +224,5 @@ def _save_servers_json_format(config: AdapterConfig, config_path: str) -> None:
     if config.cors_origins != ["*"]:
         data["cors_origins"] = config.cors_origins
     
-    with open(config_path, 'w') as f:
-        json.dump(data, f, indent=2)
\ No newline at end of file
+    with open(config_path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
\ No newline at end of file
@@ -1,11 +1,15 @@
 import asyncio
-import json
+import hashlib
 import logging
+import re
 import time
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import orjson
 from fastapi import FastAPI, Request, HTTPException, Response, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from sse_starlette import EventSourceResponse
 from watchfiles import awatch
 
@@ -14,15 +18,94 @@ from mcp_stdio_client import MCPStdioManager
 
 logger = logging.getLogger(__name__)
 
+_SERVER_PATH_RE = re.compile(r'^/servers/([^/]+)')
+_PROBE_PATHS = frozenset(("/", "/health"))
+_MAX_CONCURRENT_RPCS = 8
+_MAX_BODY_BYTES = 16 * 1024 * 1024
+_HEARTBEAT_TEMPLATE = '{"timestamp":%f}'
+_HEALTH_CACHE_TTL = 1.0
+_TASK_CANCEL_TIMEOUT = 5.0
+
+_INITIALIZE_RESULT = {
+    "protocolVersion": "2025-03-26",
+    "serverInfo": {
+        "name": "FlowDown Adapter",
+        "version": "1.0.0"
+    },
+    "capabilities": {
+        "tools": {},
+        "resources": {},
+        "prompts": {},
+        "logging": {}
+    }
+}
+
+
+def _new_server_stats() -> Dict[str, Any]:
+    return {"requests": 0, "errors": 0, "sum_rt": 0.0, "last_request": None}
+
+
+def _jsonrpc_result(msg_id: Any, result: Any) -> Optional[Dict[str, Any]]:
+    """Build a JSON-RPC result response, or None for notifications."""
+    if msg_id is None:
+        return None
+    return {"jsonrpc": "2.0", "id": msg_id, "result": result}
+
+
+def _method_not_found(msg_id: Any, method: Optional[str]) -> Optional[Dict[str, Any]]:
+    if msg_id is None:
+        return None
+    return {
+        "jsonrpc": "2.0",
+        "id": msg_id,
+        "error": {
+            "code": -32601,
+            "message": f"Method not found: {method}"
+        }
+    }
+
+
+def _invalid_request() -> Dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "id": None,
+        "error": {
+            "code": -32600,
+            "message": "Invalid Request"
+        }
+    }
+
+
+def _report_stats(stats: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert raw accumulated stats into the public shape with a mean response time."""
+    if not stats:
+        stats = _new_server_stats()
+    requests = stats["requests"]
+    last_request = stats["last_request"]
+    if last_request is not None:
+        # Stored on the monotonic clock; report as a wall-clock timestamp
+        last_request = time.time() - (time.monotonic() - last_request)
+    return {
+        "requests": requests,
+        "errors": stats["errors"],
+        "avg_response_time": stats["sum_rt"] / requests if requests else 0.0,
+        "last_request": last_request,
+    }
+
 
 class MCPStreamableHTTPServer:
     def __init__(self, config_path: str, initial_config: AdapterConfig):
         self.config_path = Path(config_path)
         self.config = initial_config
-        self.app = FastAPI(title="FlowDown Adapter", version="1.0.0")
+        self.app = FastAPI(title="FlowDown Adapter", version="1.0.0", default_response_class=ORJSONResponse)
         self.stdio_manager = MCPStdioManager()
-        self.server_stats: Dict[str, Dict] = {}
-        self.startup_time = time.time()
+        self.server_stats: Dict[str, Dict] = defaultdict(_new_server_stats)
+        self._health_cache: Tuple[float, bytes] = (float("-inf"), b"")
+        self._server_summary_static: Dict[str, Tuple[Any, Dict[str, Any]]] = {}
+        self._rpc_semaphores: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(_MAX_CONCURRENT_RPCS)
+        )
+        self._startup_mono = time.monotonic()
         self.shutdown_event = asyncio.Event()
 
         self.app.add_middleware(
@@ -33,32 +116,54 @@ class MCPStreamableHTTPServer:
             allow_headers=["*"],
         )
 
+        # Pre-encoded initialize response; only the id varies per handshake
+        self._init_prefix = b'{"jsonrpc":"2.0","id":'
+        self._init_suffix = b',"result":' + orjson.dumps(_INITIALIZE_RESULT) + b'}'
+        self._root_prefix = b'{"name":"FlowDown Adapter","version":"1.0.0","uptime":'
+        self._root_suffix = b',"endpoints":' + orjson.dumps(
+            {"servers": "/servers", "health": "/health", "mcp_pattern": "/servers/{server_name}/mcp"}
+        ) + b'}'
+
+        self._jsonrpc_dispatch = {
+            "initialize": self._rpc_initialize,
+            "notifications/initialized": self._rpc_noop,
+            "tools/call": self._rpc_tools_call,
+            "tools/list": self._rpc_tools_list,
+            "resources/list": self._rpc_resources_list,
+            "resources/read": self._rpc_resources_read,
+            "prompts/list": self._rpc_prompts_list,
+            "prompts/get": self._rpc_prompts_get,
+            "ping": self._rpc_ping,
+        }
+
         self.setup_routes()
         self.setup_middleware()
 
         self._file_watcher_task: Optional[asyncio.Task] = None
-        self._health_monitor_task: Optional[asyncio.Task] = None
+        self._startup_task: Optional[asyncio.Task] = None
+        self._config_digest: Optional[bytes] = None
 
     def setup_middleware(self):
         @self.app.middleware("http")
         async def log_requests(request: Request, call_next):
-            start_time = time.time()
-            response = await call_next(request)
-            process_time = time.time() - start_time
+            path = request.url.path
+            if path in _PROBE_PATHS:
+                # Liveness probes are neither logged nor counted
+                return await call_next(request)
 
-            logger.info(f"{request.method} {request.url.path} - {response.status_code} - {process_time:.3f}s")
+            start_ns = time.perf_counter_ns()
+            response = await call_next(request)
+            process_time = (time.perf_counter_ns() - start_ns) / 1e9
 
-            if '/servers/' in request.url.path:
-                server_name = request.url.path.split('/servers/')[1].split('/')[0]
-                if server_name not in self.server_stats:
-                    self.server_stats[server_name] = {
-                        "requests": 0, "errors": 0, "avg_response_time": 0.0, "last_request": None
-                    }
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("%s %s - %d - %.3fs", request.method, path, response.status_code, process_time)
 
-                stats = self.server_stats[server_name]
+            match = _SERVER_PATH_RE.match(path)
+            if match:
+                stats = self.server_stats[match.group(1)]
                 stats["requests"] += 1
-                stats["last_request"] = time.time()
-                stats["avg_response_time"] = (stats["avg_response_time"] + process_time) / 2 if stats["avg_response_time"] > 0 else process_time
+                stats["last_request"] = time.monotonic()
+                stats["sum_rt"] += process_time
 
                 if response.status_code >= 400:
                     stats["errors"] += 1
@@ -79,13 +184,9 @@ class MCPStreamableHTTPServer:
             return {
                 "servers": [
                     {
-                        "name": name,
+                        **self._static_server_summary(name, client.config),
                         "running": client.running,
-                        "config": client.config.dict(),
-                        "mcp_endpoint": f"/servers/{name}/mcp",
-                        "stats": self.server_stats.get(name, {
-                            "requests": 0, "errors": 0, "avg_response_time": 0.0, "last_request": None
-                        })
+                        "stats": _report_stats(self.server_stats.get(name))
                     }
                     for name, client in self.stdio_manager.clients.items()
                 ]
@@ -97,21 +198,13 @@ class MCPStreamableHTTPServer:
             if not client:
                 raise HTTPException(status_code=404, detail=f"Server {server_name} not found")
 
-            capabilities = {}
-            if client.running:
-                try:
-                    tools = await client.list_tools()
-                    resources = await client.list_resources()
-                    prompts = await client.list_prompts()
-                    capabilities = {"tools": len(tools), "resources": len(resources), "prompts": len(prompts)}
-                except Exception as e:
-                    logger.warning(f"Could not get capabilities for {server_name}: {e}")
+            capabilities = await self._get_capabilities(server_name, client) if client.running else {}
 
             return {
                 "name": server_name,
                 "running": client.running,
-                "config": client.config.dict(),
-                "stats": self.server_stats.get(server_name, {}),
+                "config": client.config.as_dict,
+                "stats": _report_stats(self.server_stats.get(server_name)),
                 "capabilities": capabilities
             }
 
@@ -130,23 +223,47 @@ class MCPStreamableHTTPServer:
 
         @self.app.get("/health")
         async def health_check():
-            running_servers = sum(1 for client in self.stdio_manager.clients.values() if client.running)
-            total_servers = len(self.stdio_manager.clients)
-            return {
-                "status": "healthy" if running_servers > 0 else "degraded",
-                "uptime": time.time() - self.startup_time,
-                "servers": {"total": total_servers, "running": running_servers, "stopped": total_servers - running_servers},
-                "version": "1.0.0"
-            }
+            now = time.monotonic()
+            ts, payload = self._health_cache
+            if now - ts >= _HEALTH_CACHE_TTL:
+                running_servers = sum(1 for client in self.stdio_manager.clients.values() if client.running)
+                total_servers = len(self.stdio_manager.clients)
+                payload = orjson.dumps({
+                    "status": "healthy" if running_servers > 0 else "degraded",
+                    "uptime": now - self._startup_mono,
+                    "servers": {"total": total_servers, "running": running_servers, "stopped": total_servers - running_servers},
+                    "version": "1.0.0"
+                })
+                self._health_cache = (now, payload)
+            return Response(content=payload, media_type="application/json")
 
         @self.app.get("/")
         async def root():
-            return {
-                "name": "FlowDown Adapter",
-                "version": "1.0.0",
-                "uptime": time.time() - self.startup_time,
-                "endpoints": {"servers": "/servers", "health": "/health", "mcp_pattern": "/servers/{server_name}/mcp"}
-            }
+            # Everything except uptime is static, so only uptime is encoded per request
+            uptime = orjson.dumps(time.monotonic() - self._startup_mono)
+            return Response(content=self._root_prefix + uptime + self._root_suffix, media_type="application/json")
+
+    def _static_server_summary(self, name: str, config) -> Dict[str, Any]:
+        """Return the part of a /servers entry that only changes with the server's config."""
+        cached = self._server_summary_static.get(name)
+        if cached is None or cached[0] is not config:
+            cached = (config, {"name": name, "config": config.as_dict, "mcp_endpoint": f"/servers/{name}/mcp"})
+            self._server_summary_static[name] = cached
+        return cached[1]
+
+    async def _get_capabilities(self, server_name: str, client) -> Dict[str, int]:
+        """Count a server's tools, resources and prompts from the client's catalog caches."""
+        results = await asyncio.gather(
+            client.list_tools(), client.list_resources(), client.list_prompts(),
+            return_exceptions=True
+        )
+        capabilities = {}
+        for kind, result in zip(("tools", "resources", "prompts"), results):
+            if isinstance(result, Exception):
+                logger.warning(f"Could not get {kind} for {server_name}: {result}")
+            else:
+                capabilities[kind] = len(result)
+        return capabilities
 
     async def _handle_post_request(self, request: Request, server_name: str):
         """Handle POST requests with JSON-RPC messages."""
@@ -159,26 +276,48 @@ class MCPStreamableHTTPServer:
             if not client.running:
                 raise HTTPException(status_code=503, detail=f"Server {server_name} not running")
 
-            # Parse the JSON-RPC message(s)
-            body = await request.body()
             content_type = request.headers.get("content-type", "")
 
             if not content_type.startswith("application/json"):
                 raise HTTPException(status_code=400, detail="Content-Type must be application/json")
 
+            # Reject oversized bodies before buffering them
             try:
-                data = json.loads(body.decode('utf-8'))
-            except json.JSONDecodeError:
+                content_length = int(request.headers.get("content-length", "0"))
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid Content-Length")
+            if content_length > _MAX_BODY_BYTES:
+                raise HTTPException(status_code=413, detail="Request body too large")
+
+            # Stream the body so chunked uploads without Content-Length are bounded too
+            chunks = []
+            received = 0
+            async for chunk in request.stream():
+                received += len(chunk)
+                if received > _MAX_BODY_BYTES:
+                    raise HTTPException(status_code=413, detail="Request body too large")
+                chunks.append(chunk)
+            body = b"".join(chunks)
+
+            # Parse the JSON-RPC message(s)
+            try:
+                data = orjson.loads(body)
+            except orjson.JSONDecodeError:
                 raise HTTPException(status_code=400, detail="Invalid JSON")
 
             # Handle single message or batch
             if isinstance(data, list):
-                # Batch request
+                # Batch request, dispatched concurrently
+                results = await asyncio.gather(
+                    *[self._process_jsonrpc_message(client, message) for message in data],
+                    return_exceptions=True
+                )
                 responses = []
-                for message in data:
-                    response = await self._process_jsonrpc_message(client, message)
-                    if response:
-                        responses.append(response)
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.error(f"Error processing batch message: {result}")
+                    elif result:
+                        responses.append(result)
 
                 if responses:
                     return responses
@@ -187,6 +326,13 @@ class MCPStreamableHTTPServer:
                     return Response(status_code=202)
             else:
                 # Single message
+                msg_id = data.get("id") if isinstance(data, dict) else None
+                if msg_id is not None and data.get("method") == "initialize":
+                    return Response(
+                        content=self._init_prefix + orjson.dumps(msg_id) + self._init_suffix,
+                        media_type="application/json"
+                    )
+
                 response = await self._process_jsonrpc_message(client, data)
                 if response:
                     return response
@@ -233,128 +379,25 @@ class MCPStreamableHTTPServer:
             raise HTTPException(status_code=500, detail=str(e))
 
     async def _process_jsonrpc_message(self, client, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Process a single JSON-RPC message."""
+        """Process a single JSON-RPC message, capping concurrent calls per server."""
+        async with self._rpc_semaphores[client.config.name]:
+            return await self._dispatch_jsonrpc_message(client, message)
+
+    async def _dispatch_jsonrpc_message(self, client, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Dispatch a single JSON-RPC message to the MCP client."""
+        if not isinstance(message, dict):
+            return _invalid_request()
+
         method = message.get("method")
         params = message.get("params", {})
         msg_id = message.get("id")
 
-        try:
-            # Handle MCP initialization
-            if method == "initialize":
-                client_info = params.get("clientInfo", {})
-                protocol_version = params.get("protocolVersion")
-                capabilities = params.get("capabilities", {})
-
-                if msg_id is not None:
-                    return {
-                        "jsonrpc": "2.0",
-                        "id": msg_id,
-                        "result": {
-                            "protocolVersion": "2025-03-26",
-                            "serverInfo": {
-                                "name": "FlowDown Adapter",
-                                "version": "1.0.0"
-                            },
-                            "capabilities": {
-                                "tools": {},
-                                "resources": {},
-                                "prompts": {},
-                                "logging": {}
-                            }
-                        }
-                    }
-
-            elif method == "notifications/initialized":
-                # Client signals initialization is complete
-                # This is a notification, so no response needed
-                return None
-
-            elif method == "tools/call":
-                tool_name = params.get("name")
-                tool_arguments = params.get("arguments", {})
-                result = await client.call_tool(tool_name, tool_arguments)
-
-                if msg_id is not None:
-                    return {
-                        "jsonrpc": "2.0",
-                        "id": msg_id,
-                        "result": result
-                    }
-
-            elif method == "tools/list":
-                tools = await client.list_tools()
-
-                if msg_id is not None:
-                    return {
-                        "jsonrpc": "2.0",
-                        "id": msg_id,
-                        "result": {"tools": tools}
-                    }
-
-            elif method == "resources/list":
-                resources = await client.list_resources()
-
-                if msg_id is not None:
-                    return {
-                        "jsonrpc": "2.0",
-                        "id": msg_id,
-                        "result": {"resources": resources}
-                    }
-
-            elif method == "resources/read":
-                uri = params.get("uri")
-                resource = await client.read_resource(uri)
-
-                if msg_id is not None:
-                    return {
-                        "jsonrpc": "2.0",
-                        "id": msg_id,
-                        "result": resource
-                    }
-
-            elif method == "prompts/list":
-                prompts = await client.list_prompts()
-
-                if msg_id is not None:
-                    return {
-                        "jsonrpc": "2.0",
-                        "id": msg_id,
-                        "result": {"prompts": prompts}
-                    }
-
-            elif method == "prompts/get":
-                name = params.get("name")
-                arguments = params.get("arguments", {})
-                prompt = await client.get_prompt(name, arguments)
-
-                if msg_id is not None:
-                    return {
-                        "jsonrpc": "2.0",
-                        "id": msg_id,
-                        "result": prompt
-                    }
-
-            elif method == "ping":
-                # Handle ping requests
-                if msg_id is not None:
-                    return {
-                        "jsonrpc": "2.0",
-                        "id": msg_id,
-                        "result": {}
-                    }
-
-            else:
-                # Unknown method
-                if msg_id is not None:
-                    return {
-                        "jsonrpc": "2.0",
-                        "id": msg_id,
-                        "error": {
-                            "code": -32601,
-                            "message": f"Method not found: {method}"
-                        }
-                    }
+        handler = self._jsonrpc_dispatch.get(method) if isinstance(method, str) else None
+        if handler is None:
+            return _method_not_found(msg_id, method)
 
+        try:
+            return await handler(client, params, msg_id)
         except Exception as e:
             logger.error(f"Error processing message {method}: {e}")
             if msg_id is not None:
@@ -369,26 +412,62 @@ class MCPStreamableHTTPServer:
 
         return None
 
+    async def _rpc_initialize(self, client, params: Dict[str, Any], msg_id: Any) -> Optional[Dict[str, Any]]:
+        return _jsonrpc_result(msg_id, _INITIALIZE_RESULT)
+
+    async def _rpc_noop(self, client, params: Dict[str, Any], msg_id: Any) -> None:
+        # Notifications such as notifications/initialized need no response
+        return None
+
+    async def _rpc_tools_call(self, client, params: Dict[str, Any], msg_id: Any) -> Optional[Dict[str, Any]]:
+        result = await client.call_tool(params.get("name"), params.get("arguments", {}))
+        return _jsonrpc_result(msg_id, result)
+
+    async def _rpc_tools_list(self, client, params: Dict[str, Any], msg_id: Any) -> Optional[Dict[str, Any]]:
+        tools = await client.list_tools()
+        return _jsonrpc_result(msg_id, {"tools": tools})
+
+    async def _rpc_resources_list(self, client, params: Dict[str, Any], msg_id: Any) -> Optional[Dict[str, Any]]:
+        resources = await client.list_resources()
+        return _jsonrpc_result(msg_id, {"resources": resources})
+
+    async def _rpc_resources_read(self, client, params: Dict[str, Any], msg_id: Any) -> Optional[Dict[str, Any]]:
+        resource = await client.read_resource(params.get("uri"))
+        return _jsonrpc_result(msg_id, resource)
+
+    async def _rpc_prompts_list(self, client, params: Dict[str, Any], msg_id: Any) -> Optional[Dict[str, Any]]:
+        prompts = await client.list_prompts()
+        return _jsonrpc_result(msg_id, {"prompts": prompts})
+
+    async def _rpc_prompts_get(self, client, params: Dict[str, Any], msg_id: Any) -> Optional[Dict[str, Any]]:
+        prompt = await client.get_prompt(params.get("name"), params.get("arguments", {}))
+        return _jsonrpc_result(msg_id, prompt)
+
+    async def _rpc_ping(self, client, params: Dict[str, Any], msg_id: Any) -> Optional[Dict[str, Any]]:
+        return _jsonrpc_result(msg_id, {})
+
     async def _stream_generator(self, client, server_name: str):
         """Generate streaming events for Streamable HTTP (optional SSE support)."""
         session_id = f"{server_name}_{id(client)}"
 
+        loop = asyncio.get_running_loop()
+
         try:
             # Send initial connection event
             yield {
                 "event": "connected",
-                "data": json.dumps({
+                "data": orjson.dumps({
                     "server": server_name,
-                    "timestamp": asyncio.get_event_loop().time(),
+                    "timestamp": loop.time(),
                     "protocol": "MCP Streamable HTTP"
-                })
+                }).decode()
             }
 
             while client.running:
-                # Send heartbeat
+                # Send heartbeat; the payload is a single float, so format it directly
                 yield {
                     "event": "heartbeat",
-                    "data": json.dumps({"timestamp": asyncio.get_event_loop().time()})
+                    "data": _HEARTBEAT_TEMPLATE % loop.time()
                 }
 
                 await asyncio.sleep(30)  # Heartbeat every 30 seconds
@@ -407,7 +486,6 @@ class MCPStreamableHTTPServer:
             if server_config.enabled:
                 try:
                     await self.stdio_manager.add_server(server_config)
-                    logger.info(f"Started MCP server: {server_config.name}")
                     enabled_count += 1
                 except Exception as e:
                     logger.error(f"Failed to start server {server_config.name}: {e}")
@@ -425,6 +503,20 @@ class MCPStreamableHTTPServer:
                     endpoint_url = f"http://{self.config.host}:{self.config.port}/servers/{server_config.name}/mcp"
                     logger.info(f"  - {server_config.name}: {endpoint_url}")
 
+        # Handshakes finish in the background so the HTTP server can bind right away
+        self._startup_task = asyncio.create_task(self._log_server_readiness())
+
+    async def _log_server_readiness(self, names: Optional[List[str]] = None, message: str = "Started MCP server"):
+        """Report which servers completed their initialize handshake."""
+        if names is None:
+            names = list(self.stdio_manager.tasks)
+        results = await asyncio.gather(*(self.stdio_manager.wait_ready(name) for name in names))
+        for name, ready in zip(names, results):
+            if ready:
+                logger.info(f"{message}: {name}")
+            else:
+                logger.warning(f"MCP server {name} did not become ready")
+
     async def stop_servers(self):
         """Stop all MCP servers."""
         await self.stdio_manager.stop_all()
@@ -438,7 +530,7 @@ class MCPStreamableHTTPServer:
                 await self.stdio_manager.remove_server(server_name)
                 await asyncio.sleep(1)  # Give it a moment
                 await self.stdio_manager.add_server(config)
-                logger.info(f"Restarted server: {server_name}")
+                await self._log_server_readiness([server_name], "Restarted server")
         except Exception as e:
             logger.error(f"Failed to restart server {server_name}: {e}")
 
@@ -452,9 +544,14 @@ class MCPStreamableHTTPServer:
             old_servers = {s.name: s for s in self.config.servers}
             new_servers = {s.name: s for s in new_config.servers}
 
+            updated: List[str] = []
+            added: List[str] = []
+
             # Remove servers that are no longer in config
             for name in old_servers:
                 if name not in new_servers:
+                    self._server_summary_static.pop(name, None)
+                    self._rpc_semaphores.pop(name, None)
                     await self.stdio_manager.remove_server(name)
                     logger.info(f"Removed server: {name}")
 
@@ -462,40 +559,59 @@ class MCPStreamableHTTPServer:
             for name, server_config in new_servers.items():
                 if name in old_servers:
                     old_config = old_servers[name]
-                    # Check if config changed
-                    if (old_config.command != server_config.command or
-                        old_config.args != server_config.args or
-                        old_config.env != server_config.env or
-                        old_config.disabled != server_config.disabled):
+                    # Structural comparison; equivalent configs keep running untouched
+                    if old_config != server_config:
                         # Restart with new config
                         await self.stdio_manager.remove_server(name)
                         await asyncio.sleep(0.5)
-                        if not server_config.disabled:
+                        if server_config.disabled:
+                            logger.info(f"Updated server: {name}")
+                        else:
                             await self.stdio_manager.add_server(server_config)
-                        logger.info(f"Updated server: {name}")
+                            updated.append(name)
                 else:
                     # New server
                     if not server_config.disabled:
                         await self.stdio_manager.add_server(server_config)
-                        logger.info(f"Added server: {name}")
+                        added.append(name)
 
             # Update adapter config
             self.config = new_config
+
+            # Servers handshake concurrently; report each once it can answer requests
+            await asyncio.gather(
+                self._log_server_readiness(updated, "Updated server"),
+                self._log_server_readiness(added, "Added server"),
+            )
             logger.info("Configuration reloaded successfully")
 
         except Exception as e:
             logger.error(f"Failed to reload configuration: {e}")
 
+    def _read_config_digest(self) -> Optional[bytes]:
+        """Hash the configuration file contents, or None if it cannot be read."""
+        try:
+            return hashlib.blake2b(self.config_path.read_bytes(), digest_size=16).digest()
+        except OSError:
+            return None
+
     async def start_file_watcher(self):
         """Start watching configuration file for changes."""
-        if not self.config_path.exists():
+        if self.config.source_stat is None:
             logger.warning(f"Configuration file {self.config_path} does not exist")
             return
 
+        self._config_digest = self._read_config_digest()
+
         async def watch_config():
             try:
                 async for changes in awatch(self.config_path):
+                    digest = self._read_config_digest()
+                    if digest is not None and digest == self._config_digest:
+                        logger.debug(f"Configuration content unchanged, skipping reload: {changes}")
+                        continue
                     logger.info(f"Configuration file changed: {changes}")
+                    self._config_digest = digest
                     await self._reload_config()
             except Exception as e:
                 logger.error(f"Error in file watcher: {e}")
@@ -503,45 +619,25 @@ class MCPStreamableHTTPServer:
         self._file_watcher_task = asyncio.create_task(watch_config())
         logger.info(f"Started file watcher for {self.config_path}")
 
-    async def start_health_monitor(self):
-        """Start health monitoring task."""
-        async def monitor_health():
-            while not self.shutdown_event.is_set():
-                try:
-                    # Check server health periodically
-                    for name, client in self.stdio_manager.clients.items():
-                        if client.running:
-                            try:
-                                # Simple ping to check if server is responsive
-                                # This is optional and might not be supported by all servers
-                                pass
-                            except Exception as e:
-                                logger.warning(f"Health check failed for {name}: {e}")
-
-                    await asyncio.sleep(60)  # Check every minute
-                except Exception as e:
-                    logger.error(f"Error in health monitor: {e}")
-                    await asyncio.sleep(60)
-
-        self._health_monitor_task = asyncio.create_task(monitor_health())
-        logger.info("Started health monitor")
-
     async def startup(self):
         await self.start_servers()
-        if self.config_path.exists():
+        # load_config already stat()ed the file; start_file_watcher reuses that result
+        if self.config.source_stat is not None:
             await self.start_file_watcher()
-        await self.start_health_monitor()
 
     async def shutdown(self):
         """Application shutdown."""
         logger.info("Shutting down MCP adapter...")
         self.shutdown_event.set()
 
-        # Cancel background tasks
-        if self._file_watcher_task:
-            self._file_watcher_task.cancel()
-        if self._health_monitor_task:
-            self._health_monitor_task.cancel()
+        # Cancel background tasks and wait for them to unwind
+        tasks = [t for t in (self._file_watcher_task, self._startup_task) if t is not None]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks, timeout=_TASK_CANCEL_TIMEOUT)
+        self._file_watcher_task = None
+        self._startup_task = None
 
         # Stop all servers
         await self.stop_servers()
@@ -1,17 +1,16 @@
 #!/usr/bin/env python3
 
+import importlib.util
 import logging
 import sys
 from pathlib import Path
 
 import click
-import uvicorn
-from rich.console import Console
-from rich.table import Table
-from rich import print as rprint
 
 from config import AdapterConfig, ServerConfig, load_config, save_config
-from http_server import MCPStreamableHTTPServer
+
+# Heavy dependencies (uvicorn, the FastAPI app, rich) are imported
+# inside the commands that use them to keep CLI cold start fast.
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -29,6 +28,10 @@ def cli():
 @click.option('--debug', '-d', is_flag=True, help='Enable debug mode')
 @click.option('--no-reload', is_flag=True, help='Disable auto-reload on config changes')
 def serve(config: str, host: str, port: int, debug: bool, no_reload: bool):
+    import uvicorn
+    from rich import print as rprint
+    from http_server import MCPStreamableHTTPServer
+
     try:
         adapter_config = load_config(config)
         if host != 'localhost':
@@ -46,13 +49,13 @@ def serve(config: str, host: str, port: int, debug: bool, no_reload: bool):
         rprint("[yellow]No servers configured. Please add servers to your configuration file.[/yellow]")
     
     # Show startup info
-    enabled_servers = [s for s in adapter_config.servers if s.enabled]
-    disabled_servers = [s for s in adapter_config.servers if not s.enabled]
-    hot_reload = not no_reload and Path(config).exists()
+    enabled_count = sum(1 for s in adapter_config.servers if s.enabled)
+    disabled_count = len(adapter_config.servers) - enabled_count
+    hot_reload = not no_reload and adapter_config.source_stat is not None
     
     rprint(f"[green]Starting MCP Adapter on {adapter_config.host}:{adapter_config.port}[/green]")
     rprint(f"[blue]Configuration: {config}[/blue]")
-    rprint(f"[blue]Servers: {len(enabled_servers)} enabled, {len(disabled_servers)} disabled[/blue]")
+    rprint(f"[blue]Servers: {enabled_count} enabled, {disabled_count} disabled[/blue]")
     if hot_reload:
         rprint("[blue]Hot-reload: enabled[/blue]")
     else:
@@ -65,14 +68,21 @@ def serve(config: str, host: str, port: int, debug: bool, no_reload: bool):
     server.app.add_event_handler("startup", server.startup)
     server.app.add_event_handler("shutdown", server.shutdown)
     
-    # Run the server
-    uvicorn.run(
+    # Run the server in this process; driving uvicorn.Server directly never
+    # goes through the multiprocess supervisor (and its spawn-based workers)
+    uvicorn_config = uvicorn.Config(
         server.app,
         host=adapter_config.host,
         port=adapter_config.port,
         log_level="debug" if adapter_config.debug else "info",
+        # Prefer uvloop/httptools (installed with uvicorn[standard]), falling back to asyncio/h11
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+        lifespan="on",
+        workers=1,
         reload=False  # We handle our own reloading
     )
+    uvicorn.Server(uvicorn_config).run()
 
 
 @cli.command()
@@ -141,8 +151,8 @@ def add_server(config: str, name: str, command: str, args, env):
     # Parse environment variables
     env_dict = {}
     for env_var in env:
-        if '=' in env_var:
-            key, value = env_var.split('=', 1)
+        key, sep, value = env_var.partition('=')
+        if sep:
             env_dict[key] = value
     
     # Add new server
@@ -168,9 +178,12 @@ def add_server(config: str, name: str, command: str, args, env):
 @click.option('--config', '-c', default='servers.json', help='Configuration file path')
 def list_servers(config: str):
     """List configured MCP servers."""
+    from rich import print as rprint
+    from rich.console import Console
+    from rich.table import Table
     
     try:
-        adapter_config = load_config(config)
+        adapter_config = load_config(config, use_cache=False)
     except Exception as e:
         rprint(f"[red]Failed to load configuration: {e}[/red]")
         sys.exit(1)
@@ -192,7 +205,7 @@ def list_servers(config: str):
         status = "✅ enabled" if server.enabled else "❌ disabled"
         command = server.command
         args = " ".join(server.args) if server.args else ""
-        env_vars = ", ".join([f"{k}={v}" for k, v in server.env.items()]) if server.env else ""
+        env_vars = ", ".join(f"{k}={v}" for k, v in server.env.items()) if server.env else ""
         
         table.add_row(server.name, status, command, args, env_vars)
     
@@ -204,20 +217,30 @@ def list_servers(config: str):
 @click.option('--port', '-p', default=8080, help='Adapter port')
 def status(config: str, host: str, port: int):
     """Show adapter status and running servers."""
-    import requests
+    import http.client
+    import json
+    import socket
+    from rich import print as rprint
+    from rich.console import Console
+    from rich.table import Table
+    
+    # One keep-alive connection is shared by both requests
+    conn = http.client.HTTPConnection(host, port, timeout=5)
+    
+    def get_json(path: str):
+        conn.request("GET", path)
+        return json.loads(conn.getresponse().read())
     
     try:
         # Check if adapter is running
-        response = requests.get(f"http://{host}:{port}/health", timeout=5)
-        health = response.json()
+        health = get_json("/health")
         
         rprint(f"[green]✅ MCP Adapter is running[/green]")
         rprint(f"[blue]Uptime: {health['uptime']:.1f} seconds[/blue]")
         rprint(f"[blue]Version: {health['version']}[/blue]")
         
         # Get server status
-        response = requests.get(f"http://{host}:{port}/servers", timeout=5)
-        servers = response.json()["servers"]
+        servers = get_json("/servers")["servers"]
         
         console = Console()
         table = Table(title="Running MCP Servers")
@@ -241,11 +264,13 @@ def status(config: str, host: str, port: int):
         
         console.print(table)
         
-    except requests.exceptions.ConnectionError:
+    except (ConnectionError, TimeoutError, socket.gaierror):
         rprint(f"[red]❌ MCP Adapter is not running on {host}:{port}[/red]")
         rprint(f"[yellow]Start it with: python main.py serve --config {config}[/yellow]")
     except Exception as e:
         rprint(f"[red]Error checking status: {e}[/red]")
+    finally:
+        conn.close()
 
 
 if __name__ == "__main__":
@@ -1,21 +1,68 @@
 import asyncio
+import functools
+import inspect
 import logging
 from typing import Dict, Optional, Any, Callable, List
-from mcp import ClientSession, StdioServerParameters
+from mcp import ClientSession, StdioServerParameters, types
 from mcp.client.stdio import stdio_client
 from config import ServerConfig
 
 logger = logging.getLogger(__name__)
 
+# Server notifications that invalidate a cached catalog, mapped to the cache attribute
+_LIST_CHANGED_CACHES = {
+    "notifications/tools/list_changed": "_tools_cache",
+    "notifications/resources/list_changed": "_resources_cache",
+    "notifications/prompts/list_changed": "_prompts_cache",
+}
+
+# Upper bound on waiting for a server's initialize handshake (seconds)
+_STARTUP_READY_TIMEOUT = 30.0
+
+
+def _requires_session(action: str):
+    """Guard a client method on a connected session and log failures.
+
+    ``action`` describes the call for error logs and is formatted with the
+    method's bound arguments, e.g. ``"call tool {name}"``.
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+        
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            if self.session is None:
+                raise RuntimeError(f"Client {self.config.name} is not connected")
+            try:
+                return await fn(self, *args, **kwargs)
+            except Exception as e:
+                description = action.format(**signature.bind(self, *args, **kwargs).arguments)
+                logger.error(f"Failed to {description} on {self.config.name}: {e}")
+                raise
+        return wrapper
+    return decorator
+
 
 class MCPStdioClient:
     """MCP STDIO client using the official SDK."""
     
+    __slots__ = (
+        "config", "session", "running",
+        "_tools_cache", "_resources_cache", "_prompts_cache", "_cache_generations",
+        "_stop_event", "ready",
+    )
+    
     def __init__(self, config: ServerConfig):
         self.config = config
         self.session: Optional[ClientSession] = None
         self.running = False
-        self.message_handlers: Dict[str, Callable] = {}
+        self._tools_cache: Optional[List[Any]] = None
+        self._resources_cache: Optional[List[Any]] = None
+        self._prompts_cache: Optional[List[Any]] = None
+        # Bumped on every invalidation so in-flight fetches don't store stale catalogs
+        self._cache_generations: Dict[str, int] = dict.fromkeys(_LIST_CHANGED_CACHES.values(), 0)
+        self._stop_event = asyncio.Event()
+        self.ready = asyncio.Event()
         
     async def start(self):
         """Start the MCP STDIO client connection."""
@@ -24,12 +71,9 @@ class MCPStdioClient:
             
         try:
             # Create server parameters
-            # Combine command and args into full command list
-            full_command = [self.config.command] + (self.config.args or [])
-            
             server_params = StdioServerParameters(
-                command=full_command[0],
-                args=full_command[1:] if len(full_command) > 1 else [],
+                command=self.config.command,
+                args=list(self.config.args or ()),
                 env=self.config.env or None
             )
             
@@ -37,18 +81,17 @@ class MCPStdioClient:
             stdio_transport = stdio_client(server_params)
             
             async with stdio_transport as (read, write):
-                async with ClientSession(read, write) as session:
+                async with ClientSession(read, write, message_handler=self._handle_message) as session:
+                    # Initialize the session; only then is it safe to route requests
+                    await session.initialize()
                     self.session = session
                     self.running = True
-                    
-                    # Initialize the session
-                    await session.initialize()
+                    self.ready.set()
                     
                     logger.info(f"Started MCP STDIO client: {self.config.name}")
                     
-                    # Keep the connection alive
-                    while self.running:
-                        await asyncio.sleep(1)
+                    # Keep the connection alive until stop() is called
+                    await self._stop_event.wait()
                         
         except Exception as e:
             logger.error(f"Failed to start MCP client {self.config.name}: {e}")
@@ -58,88 +101,81 @@ class MCPStdioClient:
     async def stop(self):
         """Stop the MCP STDIO client connection."""
         self.running = False
+        self._stop_event.set()
+        self._clear_list_caches()
         if self.session:
             # Session will be cleaned up when the context manager exits
             pass
         logger.info(f"Stopped MCP STDIO client: {self.config.name}")
     
+    async def _handle_message(self, message: Any) -> None:
+        """Invalidate catalog caches on list_changed server notifications."""
+        if isinstance(message, types.ServerNotification):
+            method = message.root.method
+            cache = _LIST_CHANGED_CACHES.get(method)
+            if cache is not None:
+                self._invalidate_cache(cache)
+                logger.debug(f"Invalidated {method} cache on {self.config.name}")
+    
+    def _invalidate_cache(self, cache: str) -> None:
+        self._cache_generations[cache] += 1
+        setattr(self, cache, None)
+    
+    def _clear_list_caches(self) -> None:
+        for cache in self._cache_generations:
+            self._invalidate_cache(cache)
+    
+    async def _cached_list(self, cache: str, fetch: Callable[[], Any], field: str) -> List[Any]:
+        """Return a cached catalog, fetching it on a miss.
+
+        The result is only stored if no invalidation happened while ``fetch`` ran.
+        """
+        items = getattr(self, cache)
+        if items is None:
+            generation = self._cache_generations[cache]
+            items = getattr(await fetch(), field)
+            if self._cache_generations[cache] == generation:
+                setattr(self, cache, items)
+        return items
+    
+    @_requires_session("call tool {name}")
     async def call_tool(self, name: str, arguments: Dict[str, Any] = None) -> Any:
         """Call a tool on the MCP server."""
-        if not self.session:
-            raise RuntimeError(f"Client {self.config.name} is not connected")
-            
-        try:
-            result = await self.session.call_tool(name, arguments or {})
-            logger.debug(f"Called tool {name} on {self.config.name}: {result}")
-            return result
-        except Exception as e:
-            logger.error(f"Failed to call tool {name} on {self.config.name}: {e}")
-            raise
+        result = await self.session.call_tool(name, arguments or {})
+        logger.debug(f"Called tool {name} on {self.config.name}: {result}")
+        return result
     
+    @_requires_session("list tools")
     async def list_tools(self) -> List[Any]:
         """List available tools from the MCP server."""
-        if not self.session:
-            raise RuntimeError(f"Client {self.config.name} is not connected")
-            
-        try:
-            result = await self.session.list_tools()
-            return result.tools
-        except Exception as e:
-            logger.error(f"Failed to list tools on {self.config.name}: {e}")
-            raise
+        return await self._cached_list("_tools_cache", self.session.list_tools, "tools")
     
+    @_requires_session("list resources")
     async def list_resources(self) -> List[Any]:
         """List available resources from the MCP server."""
-        if not self.session:
-            raise RuntimeError(f"Client {self.config.name} is not connected")
-            
-        try:
-            result = await self.session.list_resources()
-            return result.resources
-        except Exception as e:
-            logger.error(f"Failed to list resources on {self.config.name}: {e}")
-            raise
+        return await self._cached_list("_resources_cache", self.session.list_resources, "resources")
     
+    @_requires_session("read resource {uri}")
     async def read_resource(self, uri: str) -> Any:
         """Read a resource from the MCP server."""
-        if not self.session:
-            raise RuntimeError(f"Client {self.config.name} is not connected")
-            
-        try:
-            result = await self.session.read_resource(uri)
-            return result
-        except Exception as e:
-            logger.error(f"Failed to read resource {uri} on {self.config.name}: {e}")
-            raise
+        return await self.session.read_resource(uri)
     
+    @_requires_session("list prompts")
     async def list_prompts(self) -> List[Any]:
         """List available prompts from the MCP server."""
-        if not self.session:
-            raise RuntimeError(f"Client {self.config.name} is not connected")
-            
-        try:
-            result = await self.session.list_prompts()
-            return result.prompts
-        except Exception as e:
-            logger.error(f"Failed to list prompts on {self.config.name}: {e}")
-            raise
+        return await self._cached_list("_prompts_cache", self.session.list_prompts, "prompts")
     
+    @_requires_session("get prompt {name}")
     async def get_prompt(self, name: str, arguments: Dict[str, Any] = None) -> Any:
         """Get a prompt from the MCP server."""
-        if not self.session:
-            raise RuntimeError(f"Client {self.config.name} is not connected")
-            
-        try:
-            result = await self.session.get_prompt(name, arguments or {})
-            return result
-        except Exception as e:
-            logger.error(f"Failed to get prompt {name} on {self.config.name}: {e}")
-            raise
+        return await self.session.get_prompt(name, arguments or {})
 
 
 class MCPStdioManager:
     """Manager for multiple MCP STDIO clients."""
     
+    __slots__ = ("clients", "tasks")
+    
     def __init__(self):
         self.clients: Dict[str, MCPStdioClient] = {}
         self.tasks: Dict[str, asyncio.Task] = {}
@@ -157,11 +193,26 @@ class MCPStdioManager:
             task = asyncio.create_task(client.start())
             self.tasks[config.name] = task
             
-            # Wait a bit to ensure connection is established
-            await asyncio.sleep(0.1)
-            
         return client
     
+    async def wait_ready(self, name: str, timeout: float = _STARTUP_READY_TIMEOUT) -> bool:
+        """Wait until a client's session is initialized.
+
+        Returns False if the start task fails first or ``timeout`` elapses.
+        """
+        client = self.clients.get(name)
+        task = self.tasks.get(name)
+        if client is None or task is None:
+            return False
+        
+        ready = asyncio.ensure_future(client.ready.wait())
+        try:
+            await asyncio.wait({ready, task}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if not ready.done():
+                ready.cancel()
+        return client.ready.is_set()
+    
     async def remove_server(self, name: str):
         """Remove and stop an MCP STDIO client."""
         if name in self.clients:
@@ -180,10 +231,26 @@ class MCPStdioManager:
         """Get a client by name."""
         return self.clients.get(name)
     
+    async def list_all_tools(self) -> Dict[str, Any]:
+        """List tools from every client concurrently; failed clients map to their exception."""
+        return await self._gather_from_clients(lambda client: client.list_tools())
+    
+    async def list_all_resources(self) -> Dict[str, Any]:
+        """List resources from every client concurrently; failed clients map to their exception."""
+        return await self._gather_from_clients(lambda client: client.list_resources())
+    
+    async def list_all_prompts(self) -> Dict[str, Any]:
+        """List prompts from every client concurrently; failed clients map to their exception."""
+        return await self._gather_from_clients(lambda client: client.list_prompts())
+    
+    async def _gather_from_clients(self, call: Callable[[MCPStdioClient], Any]) -> Dict[str, Any]:
+        clients = list(self.clients.items())
+        results = await asyncio.gather(*(call(client) for _, client in clients), return_exceptions=True)
+        return {name: result for (name, _), result in zip(clients, results)}
+    
     async def stop_all(self):
         """Stop all clients."""
-        for client in self.clients.values():
-            await client.stop()
+        await asyncio.gather(*(client.stop() for client in self.clients.values()), return_exceptions=True)
             
         for task in self.tasks.values():
             task.cancel()